@@ -1,4 +1,3 @@
-import urllib
 from pathlib import Path
 
 import typer
@@ -9,11 +8,12 @@ from edge_containers_cli.cmds.commands import CommandError
 from edge_containers_cli.definitions import ECContext
 from edge_containers_cli.git import GitError, create_version_map
 from edge_containers_cli.shell import ShellError
-from edge_containers_cli.utils import cache_dict, new_workdir, read_cached_dict
-
-
-def url_encode(in_string: str) -> str:
-    return urllib.parse.quote(in_string, safe="")  # type: ignore
+from edge_containers_cli.utils import (
+    cache_dict,
+    new_workdir,
+    read_cached_dict,
+    url_encode,
+)
 
 
 def autocomplete_backend_init(ctx: typer.Context):
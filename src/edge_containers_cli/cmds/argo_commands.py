@@ -9,13 +9,13 @@ from datetime import datetime
 from pathlib import Path
 
 import polars
-from ruamel.yaml import YAML
 
 from edge_containers_cli.cmds.commands import CommandError, Commands, ServicesDataFrame
 from edge_containers_cli.definitions import ECContext
 from edge_containers_cli.git import set_values
 from edge_containers_cli.globals import TIME_FORMAT
 from edge_containers_cli.shell import ShellError, shell
+from edge_containers_cli.utils import load_yaml
 
 
 def extract_ns_app(target: str) -> tuple[str, str]:
@@ -35,7 +35,7 @@ def push_value(target: str, key: str, value: str | bool | int):
     app_resp = shell.run_command(
         f"argocd app get {target} -o yaml",
     )
-    app_dicts = YAML(typ="safe").load(app_resp)
+    app_dicts = load_yaml(app_resp)
     repo_url = app_dicts["spec"]["source"]["repoURL"]
     path = Path(app_dicts["spec"]["source"]["path"])
 
@@ -120,7 +120,7 @@ class ArgoCommands(Commands):
         app_resp = shell.run_command(
             f'argocd app list -l "ec_service=true" --app-namespace {namespace} -o yaml',
         )
-        app_dicts = YAML(typ="safe").load(app_resp)
+        app_dicts = load_yaml(app_resp)
 
         if not app_dicts:
             raise CommandError(f"No ec-services found in {self.target}")
@@ -137,7 +137,7 @@ class ArgoCommands(Commands):
                         f"argocd app manifests {namespace}/{name} --source live",
                     )
                     for resource_manifest in mani_resp.split("---")[1:]:
-                        manifest = YAML(typ="safe").load(resource_manifest)
+                        manifest = load_yaml(resource_manifest)
                         if not manifest:
                             continue
                         kind = manifest["kind"]
@@ -3,14 +3,20 @@ from pathlib import Path
 
 import polars
 
+import edge_containers_cli.globals as globals
 from edge_containers_cli.definitions import ENV, ECContext
 from edge_containers_cli.logging import log
+from edge_containers_cli.utils import cache_dict, read_cached_dict, url_encode
 
 
 class CommandError(Exception):
     pass
 
 
+# reference defaults for spotting unset context fields, built once
+DEFAULT_CONTEXT = ECContext()
+
+
 ServicesSchema = polars.Schema(
     {
         "name": polars.String,  # type: ignore
@@ -50,17 +56,21 @@ class Commands(ABC):
     @property
     def target(self):
         if not self._target_valid:  # Only validate once
-            if self._target == ECContext().target:
+            if self._target == DEFAULT_CONTEXT.target:
                 raise CommandError(f"Please set {ENV.target.value} or pass --target")
             else:
-                self._validate_target()
+                # Check cache to skip validating recently seen targets
+                cache_dir = globals.CACHE_ROOT / url_encode(self._target)
+                if not read_cached_dict(cache_dir, globals.TARGET_CACHE):
+                    self._validate_target()
+                    cache_dict(cache_dir, globals.TARGET_CACHE, {"valid": True})
                 self._target_valid = True
         log.debug("target = %s", self._target)
         return self._target
 
     @property
     def repo(self):
-        if self._repo == ECContext().repo:
+        if self._repo == DEFAULT_CONTEXT.repo:
             raise CommandError(f"Please set {ENV.repo.value} or pass --repo")
         else:
             log.debug("repo = %s", self._repo)
@@ -68,7 +78,7 @@ class Commands(ABC):
 
     @property
     def log_url(self):
-        if self._log_url == ECContext().log_url:
+        if self._log_url == DEFAULT_CONTEXT.log_url:
             raise CommandError(f"Please set {ENV.log_url.value} or pass --log_url")
         else:
             log.debug("log_url = %s", self._log_url)
@@ -1,13 +1,12 @@
 from pathlib import Path
 from typing import Optional
 
-from ruamel.yaml import YAML
-
 import edge_containers_cli.globals as globals
 from edge_containers_cli.cmds.commands import CommandError
 from edge_containers_cli.shell import shell
 from edge_containers_cli.utils import (
     chdir,
+    load_yaml,
     local_version,
     log,
     new_workdir,
@@ -85,7 +84,7 @@ class Helm:
 
             # Determine package name
             with open("Chart.yaml") as fp:
-                chart_yaml = YAML(typ="safe").load(fp)
+                chart_yaml = load_yaml(fp)
             package_path = (
                 service_folder / f'{chart_yaml["name"]}-{chart_yaml["version"]}.tgz'
             )
@@ -4,12 +4,13 @@ implements commands for deploying and managing service instances in the k8s clus
 Relies on the Helm class for deployment aspects.
 """
 
+import json
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import StringIO
 
 import polars
-from ruamel.yaml import YAML
 
 from edge_containers_cli.cmds.commands import CommandError, Commands, ServicesDataFrame
 from edge_containers_cli.cmds.helm import Helm
@@ -17,6 +18,9 @@ from edge_containers_cli.definitions import ECContext
 from edge_containers_cli.globals import TIME_FORMAT
 from edge_containers_cli.shell import ShellError, shell
 
+# helm release list expiry time in seconds
+HELM_LIST_EXPIRY = 5.0
+
 
 class K8sCommands(Commands):
     """
@@ -33,6 +37,8 @@ class K8sCommands(Commands):
         ctx: ECContext,
     ):
         super().__init__(ctx)
+        self._helm_df: polars.DataFrame | None = None
+        self._helm_expiry = 0.0
 
     def attach(self, service_name):
         self._check_service(service_name)
@@ -46,6 +52,7 @@ class K8sCommands(Commands):
         shell.run_command(
             f"helm delete -n {self.target} {service_name}", skip_on_dryrun=True
         )
+        self._helm_expiry = 0.0  # Releases changed
 
     def deploy(self, service_name, version, args):
         chart = Helm(
@@ -56,6 +63,7 @@ class K8sCommands(Commands):
             repo=self.repo,
         )
         chart.deploy()
+        self._helm_expiry = 0.0  # Releases changed
 
     def deploy_local(self, svc_instance, args):
         service_name = svc_instance.name.lower()
@@ -82,11 +90,11 @@ class K8sCommands(Commands):
 
     def restart(self, service_name):
         self._check_service(service_name)
-        pod_name = shell.run_command(
-            f"kubectl get -n {self.target} pod -l app={service_name} -o name",
-        )
+        # delete accepts the label selector directly - no need to look up
+        # the pod name first
         shell.run_command(
-            f"kubectl delete -n {self.target} {pod_name}", skip_on_dryrun=True
+            f"kubectl delete -n {self.target} pod -l app={service_name}",
+            skip_on_dryrun=True,
         )
 
     def start(self, service_name, temp):
@@ -104,8 +112,6 @@ class K8sCommands(Commands):
         )
 
     def template(self, svc_instance, args):
-        datetime.strftime(datetime.now(), "%Y.%-m.%-d-b%-H.%-M")
-
         service_name = svc_instance.name.lower()
 
         chart = Helm(
@@ -116,14 +122,40 @@ class K8sCommands(Commands):
         )
         chart.deploy_local(svc_instance)
 
+    def _helm_list(self) -> polars.DataFrame:
+        """
+        List the helm releases in the target namespace, cached briefly so
+        that monitor refreshes do not fork helm on every tick
+        """
+        if self._helm_df is not None and time.monotonic() < self._helm_expiry:
+            return self._helm_df
+
+        helm_out = shell.run_command(f"helm list -n {self.target} -o json")
+        if helm_out == "[]\n":
+            helm_df = polars.DataFrame({"name": [""], "version": [""]})
+        else:
+            # pass raw bytes so polars parses without an extra string copy
+            helm_df = polars.read_json(helm_out.encode())
+            helm_df = helm_df.rename({"app_version": "version"})
+
+        self._helm_df = helm_df
+        self._helm_expiry = time.monotonic() + HELM_LIST_EXPIRY
+        return helm_df
+
     def _get_services(self, running_only):
-        services_df = polars.DataFrame()
+        # Fetch the statefulsets (running & not running) and the helm
+        # releases concurrently - each is a round trip to the cluster
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kubectl_future = executor.submit(
+                shell.run_command,
+                f'kubectl get statefulset -l "is_ioc==true" -n {self.target} '
+                "-o json --chunk-size=500",
+            )
+            helm_future = executor.submit(self._helm_list)
+            kubectl_res = kubectl_future.result()
+            helm_df = helm_future.result()
 
-        # Get all statefulset services (running & not running)
-        kubectl_res = shell.run_command(
-            f'kubectl get statefulset -l "is_ioc==true" -n {self.target} -o yaml',
-        )
-        sts_dicts = YAML(typ="safe").load(kubectl_res)
+        sts_dicts = json.loads(kubectl_res)
         if not sts_dicts["items"]:
             raise CommandError(f"No ec-services found in {self.target}")
         service_data = {
@@ -146,28 +178,22 @@ class K8sCommands(Commands):
             service_data["ready"].append(is_ready)
             service_data["deployed"].append(datetime.strftime(time_stamp, TIME_FORMAT))
 
-        services_df = polars.from_dict(service_data)
-
         # Adds the version for all services
-        helm_out = str(shell.run_command(f"helm list -n {self.target} -o json"))
-        if helm_out == "[]\n":
-            helm_df = polars.DataFrame({"name": [""], "version": [""]})
-        else:
-            helm_df = polars.read_json(StringIO(str(helm_out)))
-            helm_df = helm_df.rename({"app_version": "version"})
-
-        services_df = services_df.join(
-            helm_df.select(["name", "version"]),
-            on="name",
-            how="left",
-            coalesce=True,
+        # Lazily join, arrange and filter so polars runs one optimised plan
+        services_lf = (
+            polars.from_dict(service_data)
+            .lazy()
+            .join(
+                helm_df.lazy().select(["name", "version"]),
+                on="name",
+                how="left",
+                coalesce=True,
+            )
+            .select(["name", "version", "ready", "deployed"])
         )
-
-        # Arrange columns
-        services_df = services_df.select(["name", "version", "ready", "deployed"])
         if running_only:
-            services_df = services_df.filter(polars.col("ready").eq(True))
-        return ServicesDataFrame(services_df)
+            services_lf = services_lf.filter(polars.col("ready").eq(True))
+        return ServicesDataFrame(services_lf.collect())
 
     def _get_logs(self, service_name, prev):
         self._check_service(service_name)
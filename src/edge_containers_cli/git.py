@@ -86,14 +86,20 @@ def create_version_map(
 
                 # Propagate changes through symlink target to source
                 ## Find symlink source mapping to git object
-                cmd = f"git ls-tree {tags_list[tag_no]} -r | grep 120000"
-                result_symlink_obj = str(shell.run_command(cmd, error_OK=True))
-                if not result_symlink_obj:
+                ## Filter for symlinks in python rather than a shell pipeline
+                cmd = f"git ls-tree {tags_list[tag_no]} -r"
+                result_tree = str(shell.run_command(cmd))
+                symlink_entries = [
+                    entry
+                    for entry in result_tree.rstrip().split("\n")
+                    if "120000" in entry
+                ]
+                if not symlink_entries:
                     pass
                 else:
                     symlink_object_map = {  # source path: git object
                         entry.split()[-1]: entry.split()[-2]
-                        for entry in result_symlink_obj.rstrip().split("\n")
+                        for entry in symlink_entries
                     }
 
                     ## Find symlink mapping to target file
@@ -10,6 +10,8 @@ ENV_CONFIG = "settings.yaml"
 CACHE_ROOT = Path(os.path.expanduser("~/.cache/edge-containers-cli/"))
 # available ioc cache
 SERVICE_CACHE = "service.json"
+# validated target cache
+TARGET_CACHE = "target.json"
 # cache expiry time in seconds
 CACHE_EXPIRY = 15
 # services directory
@@ -2,6 +2,7 @@
 functions for executing commands and querying environment in the linux shell
 """
 
+import shlex
 import subprocess
 
 from rich.console import Console
@@ -9,6 +10,9 @@ from rich.style import Style
 
 from .logging import log
 
+# characters that need an intermediate shell to interpret the command
+SHELL_META_CHARS = frozenset("|&;<>()$`\\*?{}[]~\n")
+
 
 class ShellError(Exception):
     pass
@@ -38,6 +42,24 @@ class ECShell:
         """
         self.console.print(output, style=Style(color="deep_sky_blue3", bold=True))
 
+    def _execute(
+        self, command: str, capture: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Execute a command, skipping the intermediate shell when the command
+        has no shell constructs (most are plain single-binary invocations)
+        """
+        if SHELL_META_CHARS.isdisjoint(command):
+            argv = shlex.split(command)
+            try:
+                return subprocess.run(argv, capture_output=capture)
+            except FileNotFoundError:
+                # match what the shell reports for a missing binary
+                return subprocess.CompletedProcess(
+                    argv, 127, b"", f"{argv[0]}: command not found\n".encode()
+                )
+        return subprocess.run(command, capture_output=capture, shell=True)
+
     def run_command(
         self,
         command: str,
@@ -59,7 +81,7 @@ class ECShell:
             self.echo_command(command)
 
         if not (self.dry_run and skip_on_dryrun):
-            p_result = subprocess.run(command, capture_output=True, shell=True)
+            p_result = self._execute(command)
             log.debug(f"running: {command}")
 
             output = p_result.stdout.decode()
@@ -101,7 +123,7 @@ class ECShell:
             self.echo_command(command)
 
         if not (self.dry_run and skip_on_dryrun):
-            p_result = subprocess.run(command, capture_output=False, shell=True)
+            p_result = self._execute(command, capture=False)
             log.debug(f"running: {command}")
 
             if p_result.returncode != 0 and not error_OK:
@@ -8,10 +8,12 @@ import os
 import shutil
 import tempfile
 import time
+import urllib.parse
 from datetime import datetime
 from pathlib import Path
 from typing import TypeVar
 
+import yaml
 from ruamel.yaml import YAML
 
 import edge_containers_cli.globals as globals
@@ -19,6 +21,17 @@ from edge_containers_cli.logging import log
 
 T = TypeVar("T")
 
+# libyaml-backed loader where available - the plain loader is pure python
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream):
+    """
+    Parse yaml for read-only use, taking the C loader when available.
+    Use YamlFile instead where comments must be preserved.
+    """
+    return yaml.load(stream, Loader=_YamlSafeLoader)
+
 
 @contextlib.contextmanager
 def chdir(path):
@@ -95,6 +108,10 @@ def public_methods(object: object) -> list:
     return public_list
 
 
+def url_encode(in_string: str) -> str:
+    return urllib.parse.quote(in_string, safe="")
+
+
 def cache_dict(cache_dir: Path, cache_file: str, data_struc: dict) -> None:
     cache = cache_dir / cache_file
     cache.parent.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,7 @@
 import os
 import re
 import shutil
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from types import SimpleNamespace
@@ -37,29 +38,37 @@ class MockRun:
         self._runner = CliRunner()
         self.log: str = ""
         self.params: list[str] = []
+        self._lock = threading.Lock()
 
     def _str_command(self, command: str, error_OK: bool = False):
-        self.log += f"\n\nFNC: ec {' '.join(self.params)}"
-        self.log += f"\nCMD: {command}"
-
-        try:
-            cmd_rsp = self.cmd_rsp.pop(0)
-        except IndexError as e:
-            raise IndexError("depleted command-response list") from e
-
-        cmd = cmd_rsp[self.cmd].format(data=DATA_PATH)
-        rsp = cmd_rsp[self.rsp]
-
-        self.log += f"\nTST: {cmd}"
-        self.log += f"\nARG: error_OK:{error_OK}"
-        self.log += f"\nRET: {rsp}\n"
-
-        # try a raw match first then use the test value as a regex
-        if cmd != command:
-            matches = re.match(cmd, command)
-            assert matches is not None, f"command mismatch: {cmd} != {command}"
-
-        return rsp
+        # Locked since some commands are now issued from worker threads
+        with self._lock:
+            self.log += f"\n\nFNC: ec {' '.join(self.params)}"
+            self.log += f"\nCMD: {command}"
+
+            if not self.cmd_rsp:
+                raise IndexError("depleted command-response list")
+
+            # Concurrently issued commands may arrive in any order so take
+            # the first remaining entry that matches.
+            # Try a raw match first then use the test value as a regex
+            for index, cmd_rsp in enumerate(self.cmd_rsp):
+                cmd = cmd_rsp[self.cmd].format(data=DATA_PATH)
+                if cmd == command or re.match(cmd, command):
+                    self.cmd_rsp.pop(index)
+                    break
+            else:
+                cmd = self.cmd_rsp[0][self.cmd].format(data=DATA_PATH)
+                self.log += f"\nTST: {cmd}"
+                raise AssertionError(f"command mismatch: {cmd} != {command}")
+
+            rsp = cmd_rsp[self.rsp]
+
+            self.log += f"\nTST: {cmd}"
+            self.log += f"\nARG: error_OK:{error_OK}"
+            self.log += f"\nRET: {rsp}\n"
+
+            return rsp
 
     def run_command(
         self,